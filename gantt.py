@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
 import seaborn as sns
 
 sns.set_theme(style="whitegrid", font_scale=1.1)
@@ -9,59 +11,65 @@ instance = "ft06"
 method = "CP"
 
 filename = f"{instance}_schedule_{method}.csv"
-df = pd.read_csv(f"results/{filename}")
-
-
-# Clean column names 
-df.columns = [c.strip() for c in df.columns]
-
-# Ensure numeric
-for col in ["Job", "Operation", "Machine", "Start", "End"]:
-    df[col] = pd.to_numeric(df[col])
+df = pd.read_csv(
+    f"results/{filename}",
+    usecols=["Job", "Operation", "Machine", "Start", "End"],
+    dtype={
+        "Job": "int32",
+        "Operation": "int32",
+        "Machine": "int32",
+        "Start": "float32",
+        "End": "float32",
+    },
+    skipinitialspace=True,  # header may be written as "Job, Operation, ..."
+    engine="c"
+)
 
-# Sort for nicer plotting
-df = df.sort_values(["Machine", "Start"]).reset_index(drop=True)
+# Sort for nicer plotting (by machine, then start time)
+order = np.lexsort((df["Start"].to_numpy(), df["Machine"].to_numpy()))
+job_ids = df["Job"].to_numpy()[order]
+op_ids = df["Operation"].to_numpy()[order]
+machine_ids = df["Machine"].to_numpy()[order]
+starts = df["Start"].to_numpy(dtype=float)[order]
+ends = df["End"].to_numpy(dtype=float)[order]
 
 # COLOR MAP (one color per job)
-jobs = sorted(df["Job"].unique())
-cmap = plt.get_cmap("tab10")  # makes it good for up to 10 jobs
-job_to_color = {job: cmap(i % 10) for i, job in enumerate(jobs)}
-
-# Palatte change
+jobs = np.unique(job_ids)
 palette = sns.color_palette("Set3", n_colors=len(jobs))
-job_to_color = dict(zip(jobs, palette))
+job_rgba = np.array([mcolors.to_rgba(c) for c in palette])  # row i = jobs[i]
 
 
 # PLOT SECTION
-machines = sorted(df["Machine"].unique())
-machine_to_y = {m: i for i, m in enumerate(machines)}
+machines = np.unique(machine_ids)
 
 fig, ax = plt.subplots(figsize=(16, 9))
 
 bar_height = 0.8
 
-for _, r in df.iterrows():
-    job = int(r["Job"])
-    op = int(r["Operation"])
-    m = int(r["Machine"])
-    start = float(r["Start"])
-    end = float(r["End"])
-    dur = end - start
-
-    y = machine_to_y[m]
-
-    ax.barh(
-        y=y,
-        width=dur,
-        left=start,
-        height=bar_height,
-        color=job_to_color[job],
-        edgecolor="black",
-        linewidth=0.6
-    )
+durs = ends - starts
+ys = np.searchsorted(machines, machine_ids)  # row index of each bar's machine
+colors = job_rgba[np.searchsorted(jobs, job_ids)]
+
+# One barh call draws every operation
+ax.barh(
+    ys,
+    durs,
+    left=starts,
+    height=bar_height,
+    color=colors,
+    edgecolor="black",
+    linewidth=0.6
+)
+
+# Labels centered on each bar, skipping bars too narrow to read
+min_label_frac = 0.015
+span = ends.max() - starts.min()
+show = durs >= min_label_frac * span
 
+xs = (starts + durs / 2)[show]
+for x, y, job, op in zip(xs, ys[show], job_ids[show], op_ids[show]):
     ax.text(
-        start + dur / 2,
+        x,
         y,
         f"J{job}-O{op}",
         ha="center",
@@ -71,7 +79,7 @@ for _, r in df.iterrows():
     )
 
 # Y axis formatting
-ax.set_yticks([machine_to_y[m] for m in machines])
+ax.set_yticks(np.arange(len(machines)))
 ax.set_yticklabels([f"M{m}" for m in machines])
 
 ax.set_xlabel("Time")
@@ -82,8 +90,8 @@ ax.grid(axis="x", linestyle="--", alpha=0.4)
 
 # Legend 
 handles = [
-    plt.Line2D([0], [0], color=job_to_color[j], lw=8, label=f"Job {j}")
-    for j in jobs
+    plt.Line2D([0], [0], color=job_rgba[i], lw=8, label=f"Job {j}")
+    for i, j in enumerate(jobs)
 ]
 
 ax.legend(
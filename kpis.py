@@ -22,45 +22,49 @@ data = {
 
 df = pd.DataFrame(data)
 
+# Palettes resolved once and reused by every plot
+muted = sns.color_palette("muted", n_colors=len(df))
+set2 = sns.color_palette("Set2", n_colors=3)
+
+# One figure, one panel per KPI plot
+fig, (ax1, ax2, ax3) = plt.subplots(
+    1, 3,
+    figsize=(20, 4),
+    gridspec_kw={"width_ratios": [6, 6, 8]},
+    constrained_layout=True
+)
+
 # Plotting makespan comparision
 
-plt.figure(figsize=(6, 4))
-ax = sns.barplot(
+sns.barplot(
     data=df,
     x="Method",
     y="Cmax",
-    palette="muted"
+    palette=muted,
+    ax=ax1
 )
-ax.set_title("FT06 — Makespan (Cmax)")
-ax.set_ylabel("Cmax")
-ax.set_xlabel("")
+ax1.set_title("FT06 — Makespan (Cmax)")
+ax1.set_ylabel("Cmax")
+ax1.set_xlabel("")
 
-for i, v in enumerate(df["Cmax"]):
-    ax.text(i, v, f"{v}", ha="center", va="bottom")
-
-plt.tight_layout()
-plt.savefig("results/figures/kpi_ft06_makespan.png", dpi=300)
-plt.close()
+for container in ax1.containers:
+    ax1.bar_label(container)
 
 # Plotting solve time comparison
 
-plt.figure(figsize=(6, 4))
-ax = sns.barplot(
+sns.barplot(
     data=df,
     x="Method",
     y="Solve Time (s)",
-    palette="muted"
+    palette=muted,
+    ax=ax2
 )
-ax.set_title("FT06 — Total Solve Time")
-ax.set_ylabel("Time (seconds)")
-ax.set_xlabel("")
-
-for i, v in enumerate(df["Solve Time (s)"]):
-    ax.text(i, v, f"{v:.2f}", ha="center", va="bottom")
+ax2.set_title("FT06 — Total Solve Time")
+ax2.set_ylabel("Time (seconds)")
+ax2.set_xlabel("")
 
-plt.tight_layout()
-plt.savefig("results/figures/kpi_ft06_solve_time.png", dpi=300)
-plt.close()
+for container in ax2.containers:
+    ax2.bar_label(container, fmt="%.2f")
 
 # Plot model size comparision
 
@@ -71,25 +75,34 @@ df_size = df.melt(
     value_name="Count"
 )
 
-plt.figure(figsize=(8, 4))
-ax = sns.barplot(
+sns.barplot(
     data=df_size,
     x="Method",
     y="Count",
     hue="Metric",
-    palette="Set2"
+    palette=set2,
+    ax=ax3
 )
 
-ax.set_title("FT06 — Model Size Comparison")
-ax.set_ylabel("Count")
-ax.set_xlabel("")
-ax.legend(title="Metric")
+ax3.set_title("FT06 — Model Size Comparison")
+ax3.set_ylabel("Count")
+ax3.set_xlabel("")
+ax3.legend(title="Metric")
 
-for container in ax.containers:
-    ax.bar_label(container, padding=2)
+for container in ax3.containers:
+    ax3.bar_label(container, padding=2)
 
-plt.tight_layout()
-plt.savefig("results/figures/kpi_ft06_model_size.png", dpi=300)
-plt.close()
+# Save each panel to its own file (the report includes them separately)
+fig.draw_without_rendering()
+renderer = fig.canvas.get_renderer()
+to_inches = fig.dpi_scale_trans.inverted()
 
+for ax, name in [
+    (ax1, "makespan"),
+    (ax2, "solve_time"),
+    (ax3, "model_size"),
+]:
+    bbox = ax.get_tightbbox(renderer).transformed(to_inches).padded(0.05)
+    fig.savefig(f"results/figures/kpi_ft06_{name}.png", dpi=300, bbox_inches=bbox)
 
+plt.close(fig)